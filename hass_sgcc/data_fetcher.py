@@ -1,10 +1,10 @@
-import base64
 import logging
 import os
 import platform
 import random
 import re
 import sqlite3
+import sys
 import time
 from datetime import datetime
 
@@ -22,66 +22,153 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
+try:
+    # SIMD 加速的 base64 解码, 未安装时退回标准库
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
 from .const import BALANCE_URL, ELECTRIC_USAGE_URL, LOGIN_URL
 from .error_watcher import ErrorWatcher
 from .onnx import ONNX
 from .sensor_updator import SensorUpdator
 
+_DIGITS_RE = re.compile(r"[0-9]+")
+
+# 复用的定位串: 常量化避免每次调用重建长字面量, 也便于页面改版时统一修改
+_XPATH_TAB_FIRST = "//div[@class='el-tabs__nav is-top']/div[@id='tab-first']"
+_XPATH_TAB_SECOND = "//div[@class='el-tabs__nav is-top']/div[@id='tab-second']"
+_XPATH_YEAR_PICKER = '//*[@id="pane-first"]/div[1]/div/div[1]/div/div/input'
+_XPATH_YEARLY_USAGE = "//ul[@class='total']/li[1]/span"
+_XPATH_YEARLY_CHARGE = "//ul[@class='total']/li[2]/span"
+_XPATH_DAILY_DATE_CELL = "//div[@class='el-tab-pane dayd']//div[@class='el-table__body-wrapper is-scrolling-none']/table/tbody/tr[1]/td[1]/div"
+_XPATH_DAILY_USAGE_CELL = "//div[@class='el-tab-pane dayd']//div[@class='el-table__body-wrapper is-scrolling-none']/table/tbody/tr[1]/td[2]/div"
+_XPATH_DAILY_ROWS = "//*[@id='pane-second']/div[2]/div[2]/div[1]/div[3]/table/tbody/tr"
+
+try:
+    # 可选依赖: 有 cv2 时 PNG 直接解码进连续 ndarray, 跳过 PIL 解码器
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    # 可选依赖: 有 numba 时用 JIT 编译的逐行扫描 (带行内提前退出)
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def _scan_alpha_bounds(alpha):
+        """两遍线性扫描 alpha 通道求透明区域包围盒, 每行命中即停"""
+        height, width = alpha.shape
+        top, bottom = -1, -1
+        left, right = width, -1
+        for y in range(height):
+            # 从左往右找本行第一个透明点
+            for x in range(width):
+                if alpha[y, x] != 0:
+                    if top == -1:
+                        top = y
+                    bottom = y
+                    if x < left:
+                        left = x
+                    break
+            else:
+                continue
+            # 从右往左找本行最后一个透明点
+            for x in range(width - 1, -1, -1):
+                if alpha[y, x] != 0:
+                    if x > right:
+                        right = x
+                    break
+        return left, top, right, bottom
+
+    # 导入期用 1x1 空图预热编译, 把 JIT 成本摊在登录流程之前
+    _scan_alpha_bounds(np.zeros((1, 1), dtype=np.uint8))
+else:
+    _scan_alpha_bounds = None
+
 
 def base64_to_PLI(base64_str: str):
-    base64_data = re.sub("^data:image/.+;base64,", "", base64_str)
-    byte_data = base64.b64decode(base64_data)
+    # 调用方一般已去掉 data URL 前缀, 这里只做兜底, 无需正则
+    if base64_str.startswith("data:"):
+        base64_str = base64_str.split(",", 1)[1]
+    byte_data = b64decode(base64_str)
     image_data = BytesIO(byte_data)
     img = Image.open(image_data)
     return img
 
 
-def get_transparency_location(image):
+def base64_to_ndarray(base64_str: str):
+    """解码 base64 图片为 RGBA ndarray
+
+    有 cv2 时用 imdecode 一步解码进连续缓冲, 省掉 BytesIO 和 PIL 的
+    惰性解码; 否则退回 PIL + np.asarray (零拷贝读取像素缓冲)。
+    """
+    if cv2 is not None:
+        if base64_str.startswith("data:"):
+            base64_str = base64_str.split(",", 1)[1]
+        buf = np.frombuffer(b64decode(base64_str), np.uint8)
+        decoded = cv2.imdecode(buf, cv2.IMREAD_UNCHANGED)
+        if decoded is not None:
+            if decoded.ndim == 3 and decoded.shape[2] == 4:
+                # cv2 输出 BGRA, 下游约定 RGBA
+                decoded = cv2.cvtColor(decoded, cv2.COLOR_BGRA2RGBA)
+            return decoded
+    return np.asarray(base64_to_PLI(base64_str))
+
+
+# uint32 像素视图里 alpha 字节的位置 (小端下 RGBA 的 A 在最高字节)
+_ALPHA_U32_MASK = np.uint32(0xFF000000 if sys.byteorder == "little" else 0x000000FF)
+
+
+def alpha_mask(rgba):
+    """计算 alpha != 0 掩码
+
+    RGBA uint8 连续数组按 uint32 视图整像素比较 (SWAR, 一次比较 4 字节),
+    避免按步长 4 单独访问 alpha 通道; 其他布局退回普通通道比较。
+    """
+    arr = np.ascontiguousarray(rgba)
+    if arr.dtype == np.uint8 and arr.ndim == 3 and arr.shape[2] == 4:
+        pixels = arr.view(np.uint32).reshape(arr.shape[0], arr.shape[1])
+        return (pixels & _ALPHA_U32_MASK) != 0
+    return arr[..., 3] != 0
+
+
+def get_transparency_location(image, mask=None):
     """获取基于透明元素裁切图片的左上角、右下角坐标
 
     :param image: cv2加载好的图像
+    :param mask: 预先算好的 alpha 掩码 (见 alpha_mask), 可省一次扫描
     :return: (left, upper, right, lower)元组
     """
-    # 1. 扫描获得最左边透明点和最右边透明点坐标
-    height, width, channel = image.shape  # 高、宽、通道数
-    assert channel == 4  # 无透明通道报错
-    first_location = None  # 最先遇到的透明点
-    last_location = None  # 最后遇到的透明点
-    first_transparency = []  # 从左往右最先遇到的透明点，元素个数小于等于图像高度
-    last_transparency = []  # 从左往右最后遇到的透明点，元素个数小于等于图像高度
-    for y, rows in enumerate(image):
-        for x, BGRA in enumerate(rows):
-            alpha = BGRA[3]
-            if alpha != 0:
-                if (
-                    not first_location or first_location[1] != y
-                ):  # 透明点未赋值或为同一列
-                    first_location = (x, y)  # 更新最先遇到的透明点
-                    first_transparency.append(first_location)
-                last_location = (x, y)  # 更新最后遇到的透明点
-        if last_location:
-            last_transparency.append(last_location)
-
-    # 2. 矩形四个边的中点
-    top = first_transparency[0]
-    bottom = first_transparency[-1]
-    left = None
-    right = None
-    for first, last in zip(first_transparency, last_transparency):
-        if not left:
-            left = first
-        if not right:
-            right = last
-        if first[0] < left[0]:
-            left = first
-        if last[0] > right[0]:
-            right = last
+    # 1. 向量化扫描 alpha 通道，避免逐像素的 Python 循环
+    assert image.shape[2] == 4  # 无透明通道报错
+    if mask is None:
+        if _scan_alpha_bounds is not None:
+            left, top, right, bottom = _scan_alpha_bounds(
+                np.ascontiguousarray(np.asarray(image)[..., 3])
+            )
+            if top == -1:
+                # 与向量化分支保持一致: 无透明点时抛 IndexError
+                raise IndexError("image has no transparent pixels")
+            return left, top, right, bottom
+        mask = alpha_mask(image)
+    rows_any = mask.any(axis=1)  # 含透明点的行
+    ys = np.where(rows_any)[0]
+    top_y, bottom_y = ys[0], ys[-1]
+
+    # 2. 每行第一个/最后一个透明点的 x 坐标
+    first_x = mask.argmax(axis=1)[rows_any]
+    last_x = (mask.shape[1] - 1) - mask[:, ::-1].argmax(axis=1)[rows_any]
 
     # 3. 左上角、右下角
-    upper_left = (left[0], top[1])  # 左上角
-    bottom_right = (right[0], bottom[1])  # 右下角
+    left_x = first_x.min()
+    right_x = last_x.max()
 
-    return upper_left[0], upper_left[1], bottom_right[0], bottom_right[1]
+    return left_x, top_y, right_x, bottom_y
 
 
 class DataFetcher:
@@ -107,6 +194,11 @@ class DataFetcher:
             os.getenv("RETRY_WAIT_TIME_OFFSET_UNIT", 10)
         )
         self.IGNORE_USER_ID = os.getenv("IGNORE_USER_ID", "xxxxx,xxxxx").split(",")
+        # 页面无可观测变化时的兜底等待, 远小于 RETRY_WAIT_TIME_OFFSET_UNIT
+        self.SLEEP_FLOOR_TIME = min(2, self.RETRY_WAIT_TIME_OFFSET_UNIT)
+        # 数据库连接首次写入时打开, 之后在各户号间复用
+        self.connect = None
+        self._ready_users = set()
 
     # @staticmethod
     def _click_button(self, driver, button_search_type, button_search_key):
@@ -119,6 +211,12 @@ class DataFetcher:
         )
         driver.execute_script("arguments[0].click();", click_element)
 
+    def _wait_until_visible(self, driver, search_type, search_key, timeout=None):
+        """轮询等待元素可见后立即返回, 代替固定时长的 time.sleep"""
+        WebDriverWait(driver, timeout or self.DRIVER_IMPLICITY_WAIT_TIME).until(
+            EC.visibility_of_element_located((search_type, search_key))
+        )
+
     # @staticmethod
     def _is_captcha_legal(self, captcha):
         """check the ddddocr result, justify whether it's legal"""
@@ -144,35 +242,48 @@ class DataFetcher:
         # time.sleep(0.2)
         ActionChains(driver).release().perform()
 
-    def connect_user_db(self, user_id):
-        """创建数据库集合，db_name = electricity_daily_usage_{user_id}
+    def _open_db(self):
+        """打开数据库连接 (幂等), 连接与 PRAGMA 在各户号间复用"""
+        if self.connect is not None:
+            return
+        # 创建数据库
+        DB_NAME = os.getenv("DB_NAME", "homeassistant.db")
+        if "PYTHON_IN_DOCKER" in os.environ:
+            if os.path.exists("/data"):
+                DB_NAME = "/data/" + DB_NAME
+            else:
+                DB_NAME = "data/" + DB_NAME
+        self.connect = sqlite3.connect(DB_NAME)
+        # 本地缓存库, 每次抓取都会重刷, 放宽持久性换取批量写入速度
+        self.connect.execute("PRAGMA journal_mode=MEMORY")
+        self.connect.execute("PRAGMA synchronous=OFF")
+        self.connect.execute("PRAGMA temp_store=MEMORY")
+        logging.info(f"Database of {DB_NAME} created successfully.")
+
+    def _ensure_user_tables(self, user_id):
+        """创建户号的数据表，db_name = electricity_daily_usage_{user_id}
         :param user_id: 用户ID"""
         try:
-            # 创建数据库
-            DB_NAME = os.getenv("DB_NAME", "homeassistant.db")
-            if "PYTHON_IN_DOCKER" in os.environ:
-                if os.path.exists("/data"):
-                    DB_NAME = "/data/" + DB_NAME
-                else:
-                    DB_NAME = "data/" + DB_NAME
-            self.connect = sqlite3.connect(DB_NAME)
-            self.connect.cursor()
-            logging.info(f"Database of {DB_NAME} created successfully.")
+            self._open_db()
             # 创建表名
             self.table_name = f"daily{user_id}"
+            # 创建data表名
+            self.table_expand_name = f"data{user_id}"
+            if user_id in self._ready_users:
+                # 同一连接里已建过表, 跳过重复的 CREATE TABLE
+                return True
             sql = f"""CREATE TABLE IF NOT EXISTS {self.table_name} (
-                    date DATE PRIMARY KEY NOT NULL, 
+                    date DATE PRIMARY KEY NOT NULL,
                     usage REAL NOT NULL)"""
             self.connect.execute(sql)
             logging.info(f"Table {self.table_name} created successfully")
 
-            # 创建data表名
-            self.table_expand_name = f"data{user_id}"
             sql = f"""CREATE TABLE IF NOT EXISTS {self.table_expand_name} (
                     name TEXT PRIMARY KEY NOT NULL,
                     value TEXT NOT NULL)"""
             self.connect.execute(sql)
             logging.info(f"Table {self.table_expand_name} created successfully")
+            self._ready_users.add(user_id)
 
         # 如果表已存在，则不会创建
         except sqlite3.Error as e:
@@ -186,9 +297,11 @@ class DataFetcher:
             return
         # 创建索引
         try:
-            sql = f"INSERT OR REPLACE INTO {self.table_name} VALUES(strftime('%Y-%m-%d','{data['date']}'),{data['usage']});"
-            self.connect.execute(sql)
-            self.connect.commit()
+            # 表名在 _ensure_user_tables 中生成, 值用 ? 占位符绑定
+            sql = f"INSERT OR REPLACE INTO {self.table_name} VALUES(strftime('%Y-%m-%d',?),?);"
+            # 连接对象作为上下文管理器, 退出时自动 COMMIT
+            with self.connect:
+                self.connect.execute(sql, (data["date"], data["usage"]))
         except BaseException as e:
             logging.debug(f"Data update failed: {e}")
 
@@ -198,9 +311,68 @@ class DataFetcher:
             return
         # 创建索引
         try:
-            sql = f"INSERT OR REPLACE INTO {self.table_expand_name} VALUES('{data['name']}','{data['value']}');"
-            self.connect.execute(sql)
-            self.connect.commit()
+            # 表名在 _ensure_user_tables 中生成, 值用 ? 占位符绑定
+            sql = f"INSERT OR REPLACE INTO {self.table_expand_name} VALUES(?,?);"
+            # 连接对象作为上下文管理器, 退出时自动 COMMIT
+            with self.connect:
+                self.connect.execute(sql, (data["name"], data["value"]))
+        except BaseException as e:
+            logging.debug(f"Data update failed: {e}")
+
+    def insert_many(self, rows: list):
+        """单事务批量写入每日用电量, rows 为 (date, usage) 元组列表"""
+        if self.connect is None:
+            logging.error("Database connection is not established.")
+            return
+        try:
+            with self.connect:
+                self.connect.executemany(
+                    f"INSERT OR REPLACE INTO {self.table_name} VALUES(strftime('%Y-%m-%d',?),?);",
+                    rows,
+                )
+        except BaseException as e:
+            logging.debug(f"Data update failed: {e}")
+
+    def _bulk_load_daily(self, rows: list):
+        """大批量导入每日用电量, 推迟主键 B-tree 维护到导入结束
+
+        行数远超正常 7/30 天窗口时, 先 executemany 写入无主键的临时表,
+        再一条 INSERT OR REPLACE ... SELECT 合并回正式表并删掉临时表,
+        全程在同一个事务内。
+        """
+        if self.connect is None:
+            logging.error("Database connection is not established.")
+            return
+        tmp_table = f"{self.table_name}_tmp"
+        try:
+            with self.connect:
+                self.connect.execute(
+                    f"""CREATE TABLE IF NOT EXISTS {tmp_table} (
+                        date DATE NOT NULL,
+                        usage REAL NOT NULL)"""
+                )
+                self.connect.executemany(
+                    f"INSERT INTO {tmp_table} VALUES(strftime('%Y-%m-%d',?),?);",
+                    rows,
+                )
+                self.connect.execute(
+                    f"INSERT OR REPLACE INTO {self.table_name} SELECT date, usage FROM {tmp_table};"
+                )
+                self.connect.execute(f"DROP TABLE {tmp_table};")
+        except BaseException as e:
+            logging.debug(f"Data update failed: {e}")
+
+    def insert_expand_many(self, rows: list):
+        """单事务批量写入扩展数据, rows 为 (name, value) 元组列表"""
+        if self.connect is None:
+            logging.error("Database connection is not established.")
+            return
+        try:
+            with self.connect:
+                self.connect.executemany(
+                    f"INSERT OR REPLACE INTO {self.table_expand_name} VALUES(?,?);",
+                    rows,
+                )
         except BaseException as e:
             logging.debug(f"Data update failed: {e}")
 
@@ -234,14 +406,16 @@ class DataFetcher:
         except Exception:
             logging.debug(f"Login failed, open URL: {LOGIN_URL} failed.")
         logging.info(f"Open LOGIN_URL:{LOGIN_URL}.\r")
-        time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT * 2)
+        # 上方已等到 .user 可见, 这里只留兜底等待
+        time.sleep(self.SLEEP_FLOOR_TIME)
         # swtich to username-password login page
         driver.find_element(By.CLASS_NAME, "user").click()
         logging.info("find_element 'user'.\r")
         self._click_button(
             driver, By.XPATH, '//*[@id="login_box"]/div[1]/div[1]/div[2]/span'
         )
-        time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
+        # 等待账号密码表单出现, 而不是固定睡眠
+        self._wait_until_visible(driver, By.CLASS_NAME, "el-input__inner")
         # click agree button
         self._click_button(
             driver,
@@ -249,7 +423,8 @@ class DataFetcher:
             '//*[@id="login_box"]/div[2]/div[1]/form/div[1]/div[3]/div/span[2]',
         )
         logging.info("Click the Agree option.\r")
-        time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
+        # 勾选协议没有可观测的页面变化, 只做兜底等待
+        time.sleep(self.SLEEP_FLOOR_TIME)
         if phone_code:
             self._click_button(
                 driver, By.XPATH, '//*[@id="login_box"]/div[1]/div[1]/div[3]/span'
@@ -285,7 +460,10 @@ class DataFetcher:
 
             # click login button
             self._click_button(driver, By.CLASS_NAME, "el-button.el-button--primary")
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT * 2)
+            # 等待滑块验证码弹出
+            self._wait_until_visible(
+                driver, By.CLASS_NAME, "slide-verify-slider-mask-item"
+            )
             logging.info("Click login button.\r")
             # sometimes ddddOCR may fail, so add retry logic)
             for retry_times in range(1, self.RETRY_TIMES_LIMIT + 1):
@@ -298,13 +476,20 @@ class DataFetcher:
                 # get base64 image data
                 im_info = driver.execute_script(background_JS)
                 background = im_info.split(",")[1]
-                background_image = base64_to_PLI(background)
+                # 只解码一次, ONNX 推理直接消费同一个 ndarray
+                background_image = base64_to_ndarray(background)
                 logging.info("Get electricity canvas image successfully.\r")
                 distance = self.onnx.get_distance(background_image)
                 logging.info(f"Image CaptCHA distance is {distance}.\r")
 
                 self._sliding_track(driver, round(distance * 1.06))  # 1.06是补偿
-                time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
+                # 轮询等待跳转, 识别失败时最多等 LOGIN_EXPECTED_TIME 秒
+                try:
+                    WebDriverWait(driver, self.LOGIN_EXPECTED_TIME).until(
+                        EC.url_changes(LOGIN_URL)
+                    )
+                except Exception:
+                    pass
                 if driver.current_url == LOGIN_URL:  # if login not success
                     try:
                         logging.info(
@@ -313,7 +498,10 @@ class DataFetcher:
                         self._click_button(
                             driver, By.CLASS_NAME, "el-button.el-button--primary"
                         )
-                        time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT * 2)
+                        # 等待滑块验证码重新弹出
+                        self._wait_until_visible(
+                            driver, By.CLASS_NAME, "slide-verify-slider-mask-item"
+                        )
                         continue
                     except Exception:
                         logging.debug(
@@ -416,6 +604,11 @@ class DataFetcher:
                     logging.info("Webdriver quit after fetching data successfully.")
                 continue
 
+        # 所有户号处理完后统一关闭复用的数据库连接
+        if self.connect is not None:
+            self.connect.close()
+            self.connect = None
+            self._ready_users.clear()
         driver.quit()
 
     def _get_current_userid(self, driver):
@@ -433,9 +626,14 @@ class DataFetcher:
                 By.XPATH,
                 """//*[@id="app"]/div/div[2]/div/div/div/div[2]/div[2]/div/button""",
             )
-        time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
+        self._wait_until_visible(driver, By.CLASS_NAME, "el-input__suffix")
         self._click_button(driver, By.CLASS_NAME, "el-input__suffix")
-        time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
+        # 等待户号下拉列表展开
+        self._wait_until_visible(
+            driver,
+            By.XPATH,
+            f"/html/body/div[2]/div[1]/div[1]/ul/li[{userid_index + 1}]/span",
+        )
         self._click_button(
             driver,
             By.XPATH,
@@ -539,10 +737,9 @@ class DataFetcher:
 
     def _get_user_ids(self, driver):
         try:
-            # 刷新网页
+            # 刷新网页, 下方的显式等待会轮询到下拉按钮出现
             driver.refresh()
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT * 2)
-            element = WebDriverWait(driver, self.DRIVER_IMPLICITY_WAIT_TIME).until(
+            WebDriverWait(driver, self.DRIVER_IMPLICITY_WAIT_TIME).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "el-dropdown"))
             )
             # click roll down button for user id
@@ -550,7 +747,6 @@ class DataFetcher:
             logging.debug(
                 """self._click_button(driver, By.XPATH, "//div[@class='el-dropdown']/span")"""
             )
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
             # wait for roll down menu displayed
             target = driver.find_element(
                 By.CLASS_NAME, "el-dropdown-menu.el-popper"
@@ -558,11 +754,9 @@ class DataFetcher:
             logging.debug(
                 """target = driver.find_element(By.CLASS_NAME, "el-dropdown-menu.el-popper").find_element(By.TAG_NAME, "li")"""
             )
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
             WebDriverWait(driver, self.DRIVER_IMPLICITY_WAIT_TIME).until(
                 EC.visibility_of(target)
             )
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
             logging.debug(
                 """WebDriverWait(driver, self.DRIVER_IMPLICITY_WAIT_TIME).until(EC.visibility_of(target))"""
             )
@@ -571,15 +765,14 @@ class DataFetcher:
                     (By.XPATH, "//ul[@class='el-dropdown-menu el-popper']/li"), ":"
                 )
             )
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
+            time.sleep(self.SLEEP_FLOOR_TIME)
 
-            # get user id one by one
-            userid_elements = driver.find_element(
-                By.CLASS_NAME, "el-dropdown-menu.el-popper"
-            ).find_elements(By.TAG_NAME, "li")
-            userid_list = []
-            for element in userid_elements:
-                userid_list.append(re.findall("[0-9]+", element.text)[-1])
+            # 一次脚本调用取回全部文本, 避免每个 li 的 .text 都走一次 WebDriver 往返
+            texts = driver.execute_script(
+                "return Array.from(document.querySelectorAll("
+                "'.el-dropdown-menu.el-popper li')).map(li => li.innerText);"
+            )
+            userid_list = [_DIGITS_RE.findall(text)[-1] for text in texts]
             return userid_list
         except Exception as e:
             logging.error(
@@ -604,7 +797,7 @@ class DataFetcher:
                 self._click_button(
                     driver,
                     By.XPATH,
-                    '//*[@id="pane-first"]/div[1]/div/div[1]/div/div/input',
+                    _XPATH_YEAR_PICKER,
                 )
                 time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
                 span_element = driver.find_element(
@@ -615,9 +808,8 @@ class DataFetcher:
             self._click_button(
                 driver,
                 By.XPATH,
-                "//div[@class='el-tabs__nav is-top']/div[@id='tab-first']",
+                _XPATH_TAB_FIRST,
             )
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
             # wait for data displayed
             target = driver.find_element(By.CLASS_NAME, "total")
             WebDriverWait(driver, self.DRIVER_IMPLICITY_WAIT_TIME).until(
@@ -629,17 +821,13 @@ class DataFetcher:
 
         # get data
         try:
-            yearly_usage = driver.find_element(
-                By.XPATH, "//ul[@class='total']/li[1]/span"
-            ).text
+            yearly_usage = driver.find_element(By.XPATH, _XPATH_YEARLY_USAGE).text
         except Exception as e:
             logging.error(f"The yearly_usage data get failed : {e}")
             yearly_usage = None
 
         try:
-            yearly_charge = driver.find_element(
-                By.XPATH, "//ul[@class='total']/li[2]/span"
-            ).text
+            yearly_charge = driver.find_element(By.XPATH, _XPATH_YEARLY_CHARGE).text
         except Exception as e:
             logging.error(f"The yearly_charge data get failed : {e}")
             yearly_charge = None
@@ -653,13 +841,12 @@ class DataFetcher:
             self._click_button(
                 driver,
                 By.XPATH,
-                "//div[@class='el-tabs__nav is-top']/div[@id='tab-second']",
+                _XPATH_TAB_SECOND,
             )
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
             # wait for data displayed
             usage_element = driver.find_element(
                 By.XPATH,
-                "//div[@class='el-tab-pane dayd']//div[@class='el-table__body-wrapper is-scrolling-none']/table/tbody/tr[1]/td[2]/div",
+                _XPATH_DAILY_USAGE_CELL,
             )
             WebDriverWait(driver, self.DRIVER_IMPLICITY_WAIT_TIME).until(
                 EC.visibility_of(usage_element)
@@ -668,7 +855,7 @@ class DataFetcher:
             # 增加是哪一天
             date_element = driver.find_element(
                 By.XPATH,
-                "//div[@class='el-tab-pane dayd']//div[@class='el-table__body-wrapper is-scrolling-none']/table/tbody/tr[1]/td[1]/div",
+                _XPATH_DAILY_DATE_CELL,
             )
             last_daily_date = date_element.text  # 获取最近一次用电量的日期
             return last_daily_date, float(usage_element.text)
@@ -683,14 +870,14 @@ class DataFetcher:
             self._click_button(
                 driver,
                 By.XPATH,
-                "//div[@class='el-tabs__nav is-top']/div[@id='tab-first']",
+                _XPATH_TAB_FIRST,
             )
-            time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
+            time.sleep(self.SLEEP_FLOOR_TIME)
             if datetime.now().month == 1:
                 self._click_button(
                     driver,
                     By.XPATH,
-                    '//*[@id="pane-first"]/div[1]/div/div[1]/div/div/input',
+                    _XPATH_YEAR_PICKER,
                 )
                 time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
                 span_element = driver.find_element(
@@ -703,21 +890,27 @@ class DataFetcher:
             WebDriverWait(driver, self.DRIVER_IMPLICITY_WAIT_TIME).until(
                 EC.visibility_of(target)
             )
-            month_element = driver.find_element(
-                By.XPATH,
+            # 浏览器内直接取单元格文本并剔除 MAX 角标, 免去整块 innerText
+            # 回传后再做 split/remove 的字符串解析
+            month_element = driver.execute_script(
+                """
+                const tbody = document.evaluate(arguments[0], document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                const cells = [];
+                for (const td of tbody.querySelectorAll('td')) {
+                    for (const part of td.innerText.split('\\n')) {
+                        const text = part.trim();
+                        if (text && text !== 'MAX') cells.push(text);
+                    }
+                }
+                return cells;
+                """,
                 "//*[@id='pane-first']/div[1]/div[2]/div[2]/div/div[3]/table/tbody",
-            ).text
-            month_element = month_element.split("\n")
-            month_element.remove("MAX")
-            month_element = np.array(month_element).reshape(-1, 3)
-            # 将每月的用电量保存为List
-            month = []
-            usage = []
-            charge = []
-            for i in range(len(month_element)):
-                month.append(month_element[i][0])
-                usage.append(month_element[i][1])
-                charge.append(month_element[i][2])
+            )
+            # 单元格按 (月份, 用电量, 电费) 三列排列, 步长切片即可拆成三个List
+            month = month_element[0::3]
+            usage = month_element[1::3]
+            charge = month_element[2::3]
             return month, usage, charge
         except Exception as e:
             logging.error(f"The month data get failed : {e}")
@@ -730,9 +923,12 @@ class DataFetcher:
         self._click_button(
             driver,
             By.XPATH,
-            "//div[@class='el-tabs__nav is-top']/div[@id='tab-second']",
+            _XPATH_TAB_SECOND,
+        )
+        # 等待天数选择出现
+        self._wait_until_visible(
+            driver, By.XPATH, "//*[@id='pane-second']/div[1]/div/label[1]/span[1]"
         )
-        time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
 
         # 7 天在第一个 label, 30 天 开通了智能缴费之后才会出现在第二个, (sb sgcc)
         if retention_days == 7:
@@ -747,29 +943,48 @@ class DataFetcher:
             logging.error(f"Unsupported retention days value: {retention_days}")
             return
 
-        time.sleep(self.RETRY_WAIT_TIME_OFFSET_UNIT)
+        time.sleep(self.SLEEP_FLOOR_TIME)
 
         # 等待用电量的数据出现
         usage_element = driver.find_element(
             By.XPATH,
-            "//div[@class='el-tab-pane dayd']//div[@class='el-table__body-wrapper is-scrolling-none']/table/tbody/tr[1]/td[2]/div",
+            _XPATH_DAILY_USAGE_CELL,
         )
         WebDriverWait(driver, self.DRIVER_IMPLICITY_WAIT_TIME).until(
             EC.visibility_of(usage_element)
         )
 
-        # 获取用电量的数据
-        days_element = driver.find_elements(
-            By.XPATH,
-            "//*[@id='pane-second']/div[2]/div[2]/div[1]/div[3]/table/tbody/tr",
-        )  # 用电量值列表
+        # 获取用电量的数据: 单次脚本调用取回全部 (日期, 用电量),
+        # 避免每行两次 WebDriver 往返 (30 天即 60 次)
+        rows = driver.execute_script(
+            """
+            const result = document.evaluate(arguments[0], document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const rows = [];
+            for (let i = 0; i < result.snapshotLength; i++) {
+                const tr = result.snapshotItem(i);
+                const day = tr.querySelector('td:nth-child(1) div');
+                const usage = tr.querySelector('td:nth-child(2) div');
+                rows.push([day ? day.innerText : '',
+                           usage ? usage.innerText : '']);
+            }
+            return rows;
+            """,
+            _XPATH_DAILY_ROWS,
+        )
         date = []
         usages = []
-        # 将用电量保存为字典
-        for i in days_element:
-            day = i.find_element(By.XPATH, "td[1]/div").text
-            usage = i.find_element(By.XPATH, "td[2]/div").text
+        # 将用电量保存为字典, 在源头转成 float, 下游不再重复解析
+        for day, usage in rows:
             if usage != "":
+                # 单行解析失败只跳过该行, 不中断整个户号的抓取
+                try:
+                    usage = float(usage)
+                except ValueError as e:
+                    logging.debug(
+                        f"The electricity consumption of {day} failed to parse: {e}"
+                    )
+                    continue
                 usages.append(usage)
                 date.append(day)
             else:
@@ -791,56 +1006,32 @@ class DataFetcher:
         yearly_usage,
     ):
         # 连接数据库集合
-        if self.connect_user_db(user_id):
-            # 写入当前户号
-            dic = {"name": "user", "value": f"{user_id}"}
-            self.insert_expand_data(dic)
-            # 写入剩余金额
-            dic = {"name": "balance", "value": f"{balance}"}
-            self.insert_expand_data(dic)
-            # 写入最近一次更新时间
-            dic = {"name": "daily_date", "value": f"{last_daily_date}"}
-            self.insert_expand_data(dic)
-            # 写入最近一次更新时间用电量
-            dic = {"name": "daily_usage", "value": f"{last_daily_usage}"}
-            self.insert_expand_data(dic)
-
-            # 写入年用电量
-            dic = {"name": "yearly_usage", "value": f"{yearly_usage}"}
-            self.insert_expand_data(dic)
-            # 写入年用电电费
-            dic = {"name": "yearly_charge", "value": f"{yearly_charge} "}
-            self.insert_expand_data(dic)
-
-            for index in range(len(date)):
-                dic = {"date": date[index], "usage": float(usages[index])}
-                # 插入到数据库
-                try:
-                    self.insert_data(dic)
-                    logging.info(
-                        f"The electricity consumption of {usages[index]}KWh on {date[index]} has been successfully deposited into the database"
-                    )
-                except Exception as e:
-                    logging.debug(
-                        f"The electricity consumption of {date[index]} failed to save to the database, which may already exist: {str(e)}"
-                    )
+        if self._ensure_user_tables(user_id):
+            expand_rows = [
+                # 当前户号
+                ("user", f"{user_id}"),
+                # 剩余金额
+                ("balance", f"{balance}"),
+                # 最近一次更新时间
+                ("daily_date", f"{last_daily_date}"),
+                # 最近一次更新时间用电量
+                ("daily_usage", f"{last_daily_usage}"),
+                # 年用电量
+                ("yearly_usage", f"{yearly_usage}"),
+                # 年用电电费
+                ("yearly_charge", f"{yearly_charge} "),
+            ]
+
+            # 每日用电量 (usages 已是 float, 直接绑定数值参数)
+            daily_rows = list(zip(date, usages))
+
+            # 每月用电量/电费 (月数据抓取失败时为 None, 不影响其余数据落库)
+            for m, m_usage, m_charge in zip(
+                month or [], month_usage or [], month_charge or []
+            ):
+                expand_rows.append((f"{m}usage", f"{m_usage}"))
+                expand_rows.append((f"{m}charge", f"{m_charge}"))
 
-            for index in range(len(month)):
-                try:
-                    dic = {
-                        "name": f"{month[index]}usage",
-                        "value": f"{month_usage[index]}",
-                    }
-                    self.insert_expand_data(dic)
-                    dic = {
-                        "name": f"{month[index]}charge",
-                        "value": f"{month_charge[index]}",
-                    }
-                    self.insert_expand_data(dic)
-                except Exception as e:
-                    logging.debug(
-                        f"The electricity consumption of {month[index]} failed to save to the database, which may already exist: {str(e)}"
-                    )
             if month_charge:
                 month_charge = month_charge[-1]
             else:
@@ -850,14 +1041,20 @@ class DataFetcher:
                 month_usage = month_usage[-1]
             else:
                 month_usage = None
-            # 写入本月电量
-            dic = {"name": "month_usage", "value": f"{month_usage}"}
-            self.insert_expand_data(dic)
-            # 写入本月电费
-            dic = {"name": "month_charge", "value": f"{month_charge}"}
-            self.insert_expand_data(dic)
-            # dic = {'date': month[index], 'usage': float(month_usage[index]), 'charge': float(month_charge[index])}
-            self.connect.close()
+            # 本月电量
+            expand_rows.append(("month_usage", f"{month_usage}"))
+            # 本月电费
+            expand_rows.append(("month_charge", f"{month_charge}"))
+
+            # 两条 executemany, 各自单事务提交, 避免逐行 commit 的 fsync 开销
+            self.insert_expand_many(expand_rows)
+            if len(daily_rows) > 100:  # 远超 7/30 天窗口, 视为一次性大导入
+                self._bulk_load_daily(daily_rows)
+            else:
+                self.insert_many(daily_rows)
+            logging.info(
+                f"{len(daily_rows)} days of electricity consumption have been successfully deposited into the database"
+            )
         else:
             logging.info(
                 "The database creation failed and the data was not written correctly."
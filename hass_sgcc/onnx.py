@@ -1,4 +1,6 @@
 # import cv2
+import os
+
 import numpy as np
 import onnxruntime
 from PIL import Image, ImageDraw, ImageOps
@@ -14,7 +16,16 @@ CLASSES = ["target"]
 
 class ONNX:
     def __init__(self, onnx_file_name="captcha.onnx"):
-        self.onnx_session = onnxruntime.InferenceSession(onnx_file_name)
+        sess_options = onnxruntime.SessionOptions()
+        sess_options.intra_op_num_threads = os.cpu_count() or 1
+        self.onnx_session = onnxruntime.InferenceSession(
+            onnx_file_name,
+            sess_options=sess_options,
+            providers=["CPUExecutionProvider"],
+        )
+        self.input_name = self.onnx_session.get_inputs()[0].name
+        # 预分配推理输入缓冲, 登录重试时复用, 避免每次分配 ~2MB float32
+        self.input_buf = np.empty((1, 3, 416, 416), dtype=np.float32)
 
     # sigmoid函数
     def sigmoid(self, x):
@@ -233,16 +244,24 @@ class ONNX:
         return img, ratio, (dw, dh)
 
     def _inference(self, image):
+        if not isinstance(image, Image.Image):
+            # 也接受 ndarray 输入 (fromarray 共享 uint8 缓冲, 不复制)
+            image = Image.fromarray(image)
         # org_img = cv2.resize(image, [416, 416]) # resize后的原图 (640, 640, 3)
         org_img = image.resize((416, 416))
         # img = cv2.cvtColor(org_img, cv2.COLOR_BGR2RGB).transpose(2, 0, 1)
         img = org_img.convert("RGB")
-        img = np.array(img).transpose(2, 0, 1)
-        img = img.astype(dtype=np.float32)  # onnx模型的类型是type: float32[ , , , ]
-        img /= 255.0
-        img = np.expand_dims(img, axis=0)  # [3, 640, 640]扩展为[1, 3, 640, 640]
+        # np.asarray 走数组接口零拷贝读取像素, np.array 会多复制一份
+        # 归一化结果直接写进预分配的 [1, 3, 416, 416] 输入缓冲
+        np.divide(
+            np.asarray(img, dtype=np.float32).transpose(
+                2, 0, 1
+            ),  # onnx模型的类型是type: float32[ , , , ]
+            255.0,
+            out=self.input_buf[0],
+        )
 
-        inputs = {self.onnx_session.get_inputs()[0].name: img}
+        inputs = {self.input_name: self.input_buf}
         prediction = self.onnx_session.run(None, inputs)[0]
         return prediction, org_img
 